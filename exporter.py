@@ -8,6 +8,11 @@ import csv
 import json
 from typing import Dict, Union, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class Exporter(ABC):
     """Base abstract class for data exporters."""
     
@@ -31,12 +36,13 @@ class TxtExporter(Exporter):
             summary: Dictionary with summarized data by park
             path: Path where the .txt file will be saved
         """
-        with open(path, "w", encoding="utf-8") as fp:
-            for park, data in summary.items():
-                fp.write(f"{park}\n")
-                for k, v in data.items():
-                    fp.write(f"  {k}: {v}\n")
-                fp.write("\n")
+        parts = []
+        for park, data in summary.items():
+            parts.append(f"{park}\n")
+            parts.extend(f"  {k}: {v}\n" for k, v in data.items())
+            parts.append("\n")
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as fp:
+            fp.write("".join(parts))
 
 class CsvExporter(Exporter):
     """Exporter for CSV format."""
@@ -49,11 +55,11 @@ class CsvExporter(Exporter):
             path: Path where the .csv file will be saved
         """
         header = ["Park", "reviews", "positive", "avg", "countries"]
-        with open(path, "w", newline="", encoding="utf-8") as fp:
+        rows = [[park, *data.values()] for park, data in summary.items()]
+        with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as fp:
             writer = csv.writer(fp)
             writer.writerow(header)
-            for park, data in summary.items():
-                writer.writerow([park] + list(data.values()))
+            writer.writerows(rows)
 
 class JsonExporter(Exporter):
     """Exporter for JSON format."""
@@ -61,9 +67,15 @@ class JsonExporter(Exporter):
     def export(self, summary: Dict[str, Dict[str, Union[int, float, int]]], path: Path) -> None:
         """Exports data in indented JSON format.
 
+        Uses orjson when installed, falling back to the standard json module.
+
         Args:
             summary: Dictionary with summarized data by park
             path: Path where the .json file will be saved
         """
-        with open(path, "w", encoding="utf-8") as fp:
-            json.dump(summary, fp, indent=2, ensure_ascii=False)
\ No newline at end of file
+        if orjson is not None:
+            with open(path, "wb", buffering=1 << 20) as fp:
+                fp.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+            return
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as fp:
+            fp.write(json.dumps(summary, indent=2, ensure_ascii=False))
\ No newline at end of file
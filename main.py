@@ -3,10 +3,10 @@ Main module of the Disney reviews analyzer.
 Manages the main program loop and coordinates operations between modules.
 """
 from pathlib import Path
-from typing import List, Callable
+from typing import Callable
 from process import (
     load_reviews,
-    Review,
+    Reviews,
     get_reviews_by_park,
     count_reviews_by_park_and_location,
     avg_rating_by_park_year,
@@ -18,16 +18,15 @@ from process import (
     park_summary,
 )
 import tui
-import visual
 from exporter import TxtExporter, CsvExporter, JsonExporter
 
 EXPORTERS = {"TXT": TxtExporter, "CSV": CsvExporter, "JSON": JsonExporter}
 
-def handle_view(reviews: List[Review]) -> None:
+def handle_view(reviews: Reviews) -> None:
     """Manages the data viewing submenu.
 
     Args:
-        reviews: List of loaded reviews
+        reviews: Loaded reviews
     """
     while True:
         try:
@@ -68,12 +67,14 @@ def handle_view(reviews: List[Review]) -> None:
         except (ValueError, ZeroDivisionError) as e:
             tui.show_msg(f"Error processing data: {e}")
 
-def handle_graph(reviews: List[Review]) -> None:
+def handle_graph(reviews: Reviews) -> None:
     """Manages the graph generation submenu.
 
     Args:
-        reviews: List of loaded reviews
+        reviews: Loaded reviews
     """
+    import visual
+
     while True:
         try:
             option = tui.graph_menu()
@@ -104,11 +105,11 @@ def handle_graph(reviews: List[Review]) -> None:
         except Exception as e:
             tui.show_msg(f"Error generating graph: {e}")
 
-def handle_export(reviews: List[Review]) -> None:
+def handle_export(reviews: Reviews) -> None:
     """Manages the data export functionality.
 
     Args:
-        reviews: List of loaded reviews
+        reviews: Loaded reviews
     """
     try:
         fmt = tui.export_menu()
@@ -138,14 +139,14 @@ def main() -> None:
 
         while True:
             try:
-                choice = tui.main_menu()
-                if choice.upper() == "A":
+                choice = tui.main_menu().upper()
+                if choice == "A":
                     handle_view(reviews)
-                elif choice.upper() == "B":
+                elif choice == "B":
                     handle_graph(reviews)
-                elif choice.upper() == "C":
+                elif choice == "C":
                     handle_export(reviews)
-                elif choice.upper() == "X":
+                elif choice == "X":
                     tui.show_msg("Exiting...")
                     break
                 else:
@@ -3,14 +3,19 @@ This module handles data processing for the Disney Reviews Dataset.
 Contains functions for loading, filtering, and calculating statistics about reviews.
 """
 from __future__ import annotations
+import contextlib
 import csv
-from dataclasses import dataclass
-from collections import defaultdict, Counter, OrderedDict
+import os
+import tempfile
+import zipfile
+from functools import lru_cache
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
-@dataclass(frozen=True)
-class Review:
+import numpy as np
+
+class Review(NamedTuple):
     """Represents a review from the Disney dataset.
 
     Args:
@@ -26,196 +31,613 @@ class Review:
     location: str
     park: str
 
-def load_reviews(csv_path: Union[str, Path]) -> list[Review]:
+MONTH_NAMES = (
+    'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+    'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec',
+)
+
+def _parse_year_month(year_month: str) -> Tuple[int, int]:
+    """Splits a YYYY-MM string into year and month.
+
+    Args:
+        year_month: Date in YYYY-MM (or YYYY-M) format
+
+    Returns:
+        Year and month numbers; month is 0 when absent or out of range, both
+        are 0 when the year is missing
+    """
+    try:
+        year = int(year_month[:4])
+    except ValueError:
+        return 0, 0
+    try:
+        month = int(year_month[5:7])
+    except ValueError:
+        month = 0
+    if not 1 <= month <= 12:
+        month = 0
+    return year, month
+
+def _format_year_month(year: int, month: int) -> str:
+    """Formats year and month numbers back as YYYY-MM.
+
+    Args:
+        year: Year number (0 when missing)
+        month: Month number (0 when missing)
+
+    Returns:
+        Date in YYYY-MM format (YYYY without a month), or "missing" for an
+        empty date
+    """
+    if not year:
+        return "missing"
+    if not month:
+        return str(year)
+    return f"{year}-{month:02d}"
+
+_ROW_FIELDS = ("ids", "ratings", "year", "month", "loc_code", "park_code")
+
+@dataclass(frozen=True, eq=False)
+class Reviews:
+    """Column-oriented collection of reviews.
+
+    Each review is a row across the parallel arrays; parks and locations are
+    stored as integer codes into the ``park_names`` and ``loc_names`` tables.
+
+    Args:
+        ids: Review IDs (int32)
+        ratings: Given ratings 1-5 (int8)
+        year: Review years, 0 when missing (int16)
+        month: Review months 1-12, 0 when missing (int8)
+        loc_code: Reviewer location codes (int32)
+        park_code: Park codes (int32)
+        park_names: Park name for each park code
+        loc_names: Location name for each location code
+
+    Rows are kept grouped by park (stable, so the original order is preserved
+    within each park), with ``park_offsets`` giving each park's row range.
+    Case-folded lookup tables for case-insensitive queries are derived from
+    the name tables on construction.
+    """
+    ids: np.ndarray
+    ratings: np.ndarray
+    year: np.ndarray
+    month: np.ndarray
+    loc_code: np.ndarray
+    park_code: np.ndarray
+    park_names: List[str]
+    loc_names: List[str]
+    park_code_by_folded: Dict[str, int] = field(init=False, repr=False)
+    loc_folded: np.ndarray = field(init=False, repr=False)
+    park_offsets: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if np.any(self.park_code[1:] < self.park_code[:-1]):
+            order = np.argsort(self.park_code, kind="stable")
+            for name in _ROW_FIELDS:
+                object.__setattr__(self, name, getattr(self, name)[order])
+        counts = np.bincount(self.park_code, minlength=len(self.park_names))
+        object.__setattr__(self, "park_offsets", np.concatenate(([0], np.cumsum(counts))))
+        object.__setattr__(
+            self,
+            "park_code_by_folded",
+            {name.casefold(): i for i, name in enumerate(self.park_names)},
+        )
+        object.__setattr__(
+            self, "loc_folded", np.array([name.casefold() for name in self.loc_names], dtype=str)
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Review]) -> Reviews:
+        """Builds the columnar collection from individual reviews.
+
+        Args:
+            records: Reviews to store
+
+        Returns:
+            Reviews holding the given records
+        """
+        parks: Dict[str, int] = {}
+        locs: Dict[str, int] = {}
+        ids, ratings, dates, loc_code, park_code = [], [], [], [], []
+        for r in records:
+            ids.append(r.id)
+            ratings.append(r.rating)
+            dates.append(_parse_year_month(r.year_month))
+            loc_code.append(locs.setdefault(r.location, len(locs)))
+            park_code.append(parks.setdefault(r.park, len(parks)))
+        return cls._from_columns(ids, ratings, dates, loc_code, park_code, parks, locs)
+
+    @classmethod
+    def _from_columns(
+        cls,
+        ids: List[int],
+        ratings: List[int],
+        dates: List[Tuple[int, int]],
+        loc_code: List[int],
+        park_code: List[int],
+        parks: Dict[str, int],
+        locs: Dict[str, int],
+    ) -> Reviews:
+        """Converts parsed column lists and name tables into arrays."""
+        year, month = np.asarray(dates, dtype=np.int16).reshape(-1, 2).T
+        return cls(
+            ids=np.asarray(ids, dtype=np.int32),
+            ratings=np.asarray(ratings, dtype=np.int8),
+            year=year.copy(),
+            month=month.astype(np.int8),
+            loc_code=np.asarray(loc_code, dtype=np.int32),
+            park_code=np.asarray(park_code, dtype=np.int32),
+            park_names=list(parks),
+            loc_names=list(locs),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[Review]:
+        park_names, loc_names = self.park_names, self.loc_names
+        for i, rt, y, m, lc, pc in zip(
+            self.ids.tolist(),
+            self.ratings.tolist(),
+            self.year.tolist(),
+            self.month.tolist(),
+            self.loc_code.tolist(),
+            self.park_code.tolist(),
+        ):
+            yield Review(i, rt, _format_year_month(y, m), loc_names[lc], park_names[pc])
+
+    def park_rows(self, code: Optional[int]) -> slice:
+        """Returns the row range holding one park's reviews.
+
+        Args:
+            code: Park code, or None for an unknown park
+
+        Returns:
+            Slice over the rows (empty for an unknown park)
+        """
+        if code is None:
+            return slice(0, 0)
+        return slice(int(self.park_offsets[code]), int(self.park_offsets[code + 1]))
+
+    def select(self, index: np.ndarray) -> Reviews:
+        """Selects a subset of rows, keeping the same name tables.
+
+        Args:
+            index: Boolean mask, integer indices or slice over the rows
+
+        Returns:
+            Reviews with only the selected rows
+        """
+        return Reviews(
+            **{name: getattr(self, name)[index] for name in _ROW_FIELDS},
+            park_names=self.park_names,
+            loc_names=self.loc_names,
+        )
+
+_CACHE_VERSION = 4
+
+def _cache_key(csv_path: Path) -> np.ndarray:
+    """Builds the cache validation key from the cache format and CSV stats.
+
+    Args:
+        csv_path: Path to the CSV file
+
+    Returns:
+        Array with cache version, modification time (ns) and size
+    """
+    stat = csv_path.stat()
+    return np.array([_CACHE_VERSION, stat.st_mtime_ns, stat.st_size], dtype=np.int64)
+
+def _read_cache(cache_path: Path, key: np.ndarray) -> Optional[Reviews]:
+    """Loads previously parsed reviews if the cache matches the CSV.
+
+    Args:
+        cache_path: Path to the .npz cache
+        key: Expected cache key
+
+    Returns:
+        Cached reviews, or None if the cache is missing, stale or unreadable
+    """
+    try:
+        with np.load(cache_path) as data:
+            if not np.array_equal(data["key"], key):
+                return None
+            return Reviews(
+                **{name: data[name] for name in _ROW_FIELDS},
+                park_names=data["park_names"].tolist(),
+                loc_names=data["loc_names"].tolist(),
+            )
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+
+def _write_cache(cache_path: Path, key: np.ndarray, reviews: Reviews) -> None:
+    """Saves parsed reviews next to the CSV, replacing the cache atomically.
+
+    Failures are ignored: the cache only speeds up the next start.
+
+    Args:
+        cache_path: Path to the .npz cache
+        key: Cache key of the parsed CSV
+        reviews: Parsed reviews
+    """
+    tmp_name = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".npz", delete=False) as tmp:
+            tmp_name = tmp.name
+            np.savez(
+                tmp,
+                key=key,
+                **{name: getattr(reviews, name) for name in _ROW_FIELDS},
+                park_names=np.array(reviews.park_names, dtype=str),
+                loc_names=np.array(reviews.loc_names, dtype=str),
+            )
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        if tmp_name is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+
+_CSV_COLUMNS = ("Review_ID", "Rating", "Year_Month", "Reviewer_Location", "Branch")
+
+def _parse_csv(csv_path: Path) -> Reviews:
+    """Parses the reviews CSV with pandas' C parser when available.
+
+    pandas is imported lazily so cached starts do not pay for it; without
+    pandas the CSV is parsed with the standard csv module.
+
+    Args:
+        csv_path: Path to the CSV file
+
+    Returns:
+        Reviews parsed from CSV
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        return _parse_csv_reader(csv_path)
+
+    if csv_path.stat().st_size == 0:
+        return Reviews.from_records([])
+    df = pd.read_csv(
+        csv_path,
+        usecols=list(_CSV_COLUMNS),
+        dtype={
+            "Review_ID": "int32",
+            "Rating": "int8",
+            "Year_Month": str,
+            "Reviewer_Location": str,
+            "Branch": str,
+        },
+        keep_default_na=False,
+        encoding="utf-8",
+    )
+    # Only a few distinct dates exist, so parse each one like the csv.reader path
+    date_code, date_names = pd.factorize(df["Year_Month"])
+    dates = np.array([_parse_year_month(d) for d in date_names], dtype=np.int16)
+    year, month = dates.reshape(-1, 2).T
+    # factorize keeps first-appearance order, matching the csv.reader path
+    loc_code, loc_names = pd.factorize(df["Reviewer_Location"])
+    park_code, park_names = pd.factorize(df["Branch"])
+    return Reviews(
+        ids=df["Review_ID"].to_numpy(),
+        ratings=df["Rating"].to_numpy(),
+        year=year[date_code],
+        month=month[date_code].astype(np.int8),
+        loc_code=loc_code.astype(np.int32),
+        park_code=park_code.astype(np.int32),
+        park_names=park_names.tolist(),
+        loc_names=loc_names.tolist(),
+    )
+
+def _parse_csv_reader(csv_path: Path) -> Reviews:
+    """Parses the reviews CSV in a single csv.reader pass.
+
+    Args:
+        csv_path: Path to the CSV file
+
+    Returns:
+        Reviews parsed from CSV
+    """
+    parks: Dict[str, int] = {}
+    locs: Dict[str, int] = {}
+    ids, ratings, dates, loc_code, park_code = [], [], [], [], []
+    with open(csv_path, encoding="utf-8", newline="", buffering=1 << 20) as fp:
+        reader = csv.reader(fp)
+        header = next(reader, None)
+        if header is None:
+            return Reviews.from_records([])
+        try:
+            id_i, rt_i, ym_i, lo_i, br_i = (header.index(col) for col in _CSV_COLUMNS)
+        except ValueError:
+            missing = [col for col in _CSV_COLUMNS if col not in header]
+            raise ValueError(f"CSV is missing columns: {', '.join(missing)}") from None
+        for row in reader:
+            ids.append(int(row[id_i]))
+            ratings.append(int(row[rt_i]))
+            dates.append(_parse_year_month(row[ym_i]))
+            loc_code.append(locs.setdefault(row[lo_i], len(locs)))
+            park_code.append(parks.setdefault(row[br_i], len(parks)))
+    return Reviews._from_columns(ids, ratings, dates, loc_code, park_code, parks, locs)
+
+def load_reviews(csv_path: Union[str, Path]) -> Reviews:
     """Loads reviews from CSV file.
 
+    Parsed data is cached in a .npz file next to the CSV and reused while the
+    CSV's modification time and size are unchanged.
+
     Args:
         csv_path: Path to the CSV file
 
     Returns:
-        List of Review objects loaded from CSV
+        Reviews loaded from CSV
     """
     csv_path = Path(csv_path)
     if not csv_path.is_absolute():
         csv_path = Path(__file__).parent / csv_path
 
-    with open(csv_path, encoding="utf-8") as fp:
-        reader = csv.DictReader(fp)
-        return [
-            Review(
-                id=int(r["Review_ID"]),
-                rating=int(r["Rating"]),
-                year_month=r["Year_Month"],
-                location=r["Reviewer_Location"],
-                park=r["Branch"],
-            )
-            for r in reader
-        ]
+    _clear_query_caches()
+    key = _cache_key(csv_path)
+    cache_path = csv_path.with_suffix(".npz")
+    reviews = _read_cache(cache_path, key)
+    if reviews is None:
+        reviews = _parse_csv(csv_path)
+        _write_cache(cache_path, key, reviews)
+    return reviews
 
 # ---------- Simple Filters ---------- #
-def get_reviews_by_park(reviews: List[Review], park: str) -> List[Review]:
+# Query results are memoized per Reviews instance (hashed by identity) and
+# shared between callers, so they must be treated as read-only.
+def _park_rows(reviews: Reviews, park: str) -> slice:
+    """Resolves a case-folded park name to its row range.
+
+    Args:
+        reviews: Loaded reviews
+        park: Park name, already case-folded
+
+    Returns:
+        Slice over the park's rows (empty if the park is unknown)
+    """
+    return reviews.park_rows(reviews.park_code_by_folded.get(park))
+
+def _group_avg(sums: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Divides grouped sums by counts, leaving empty groups at 0."""
+    return np.divide(sums, counts, out=np.zeros(len(sums)), where=counts > 0)
+
+def _park_sums(reviews: Reviews, values: np.ndarray) -> np.ndarray:
+    """Sums a per-row column over each park's contiguous row range.
+
+    Uses integer accumulation over the park-grouped layout, so int8/bool
+    columns are summed without a float conversion.
+
+    Args:
+        reviews: Loaded reviews
+        values: Column aligned with the review rows
+
+    Returns:
+        Per-park totals (int64), 0 for parks without reviews
+    """
+    counts = np.diff(reviews.park_offsets)
+    sums = np.zeros(len(counts), dtype=np.int64)
+    nonempty = counts > 0
+    if nonempty.any():
+        # reduceat needs increasing, in-range starts, so skip empty parks
+        starts = reviews.park_offsets[:-1][nonempty]
+        sums[nonempty] = np.add.reduceat(values, starts, dtype=np.int64)
+    return sums
+
+def get_reviews_by_park(reviews: Reviews, park: str) -> Reviews:
     """Filters reviews by park.
 
     Args:
-        reviews: List of reviews
+        reviews: Loaded reviews
         park: Park name
 
     Returns:
         Reviews only from the specified park
     """
-    return [r for r in reviews if r.park.lower() == park.lower()]
+    return reviews.select(_park_rows(reviews, park.casefold()))
 
-def count_reviews_by_park_and_location(reviews: List[Review], park: str, loc: str) -> int:
+def count_reviews_by_park_and_location(reviews: Reviews, park: str, loc: str) -> int:
     """Counts reviews by park and location.
 
     Args:
-        reviews: List of reviews
+        reviews: Loaded reviews
         park: Park name
         loc: Location to search (partial)
 
     Returns:
         Number of reviews matching the criteria
     """
-    return sum(
-        1
-        for r in reviews
-        if r.park.lower() == park.lower() and loc.lower() in r.location.lower()
-    )
+    return _count_reviews_by_park_and_location(reviews, park.casefold(), loc.casefold())
+
+@lru_cache(maxsize=512)
+def _count_reviews_by_park_and_location(reviews: Reviews, park: str, loc: str) -> int:
+    """Cached count for a case-folded park and location."""
+    loc_matches = np.char.find(reviews.loc_folded, loc) >= 0
+    rows = _park_rows(reviews, park)
+    return int(np.count_nonzero(loc_matches[reviews.loc_code[rows]]))
 
-def avg_rating_by_park_year(reviews: List[Review], park: str, year: str) -> Optional[float]:
+def avg_rating_by_park_year(reviews: Reviews, park: str, year: str) -> Optional[float]:
     """Calculates average rating by park and year.
 
     Args:
-        reviews: List of reviews
+        reviews: Loaded reviews
         park: Park name
         year: Year (YYYY)
 
     Returns:
         Average rating or None if no data
     """
-    ratings = [
-        r.rating
-        for r in reviews
-        if r.park.lower() == park.lower() and r.year_month.startswith(str(year))
-    ]
-    return sum(ratings) / len(ratings) if ratings else None
+    return _avg_rating_by_park_year(reviews, park.casefold(), int(year))
+
+@lru_cache(maxsize=512)
+def _avg_rating_by_park_year(reviews: Reviews, park: str, year: int) -> Optional[float]:
+    """Cached yearly average for a case-folded park."""
+    # Year 0 marks reviews without a date, which match no queried year
+    if year == 0:
+        return None
+    rows = _park_rows(reviews, park)
+    mask = reviews.year[rows] == year
+    return float(reviews.ratings[rows][mask].mean()) if mask.any() else None
 
 # ---------- Statistics for Graphs ---------- #
-def reviews_count_per_park(reviews: List[Review]) -> Dict[str, int]:
+@lru_cache(maxsize=32)
+def reviews_count_per_park(reviews: Reviews) -> Dict[str, int]:
     """Counts number of reviews per park.
 
     Args:
-        reviews: List of reviews
+        reviews: Loaded reviews
 
     Returns:
         Dictionary with review count per park
     """
-    c = Counter(r.park for r in reviews)
-    return dict(c)
+    counts = np.diff(reviews.park_offsets)
+    return {p: int(c) for p, c in zip(reviews.park_names, counts) if c}
 
-def avg_rating_per_park(reviews: List[Review]) -> Dict[str, float]:
+@lru_cache(maxsize=32)
+def avg_rating_per_park(reviews: Reviews) -> Dict[str, float]:
     """Calculates average rating per park.
 
     Args:
-        reviews: List of reviews
+        reviews: Loaded reviews
 
     Returns:
         Dictionary with average rating per park
     """
-    stats = defaultdict(list)
-    for r in reviews:
-        stats[r.park].append(r.rating)
-    return {p: sum(v) / len(v) for p, v in stats.items()}
+    sums = _park_sums(reviews, reviews.ratings)
+    counts = np.diff(reviews.park_offsets)
+    avgs = _group_avg(sums, counts)
+    return {p: float(a) for p, a, c in zip(reviews.park_names, avgs, counts) if c}
 
-def top_locations_for_park(reviews: List[Review], park: str, top: int = 10) -> Dict[str, float]:
+def top_locations_for_park(reviews: Reviews, park: str, top: int = 10) -> Dict[str, float]:
     """Lists locations with best averages for a park.
 
     Args:
-        reviews: List of reviews
+        reviews: Loaded reviews
         park: Park name
         top: Number of locations to return (default: 10)
 
     Returns:
         Dictionary with top N locations and their averages
     """
-    stats = defaultdict(list)
-    for r in reviews:
-        if r.park.lower() == park.lower():
-            stats[r.location].append(r.rating)
-    avgs = {loc: sum(v) / len(v) for loc, v in stats.items()}
-    return dict(sorted(avgs.items(), key=lambda x: x[1], reverse=True)[:top])
-
-def avg_monthly_rating(reviews: List[Review], park: str) -> OrderedDict:
+    return _top_locations_for_park(reviews, park.casefold(), top)
+
+@lru_cache(maxsize=512)
+def _top_locations_for_park(reviews: Reviews, park: str, top: int) -> Dict[str, float]:
+    """Cached top locations for a case-folded park."""
+    rows = _park_rows(reviews, park)
+    codes = reviews.loc_code[rows]
+    n_loc = len(reviews.loc_names)
+    sums = np.bincount(codes, weights=reviews.ratings[rows], minlength=n_loc)
+    counts = np.bincount(codes, minlength=n_loc)
+    avgs = _group_avg(sums, counts)
+    # Ties keep the order in which locations first appear for the park
+    first_seen = np.full(n_loc, len(codes))
+    np.minimum.at(first_seen, codes, np.arange(len(codes)))
+    present = np.flatnonzero(counts)
+    best = present[np.lexsort((first_seen[present], -avgs[present]))[:top]]
+    return {reviews.loc_names[i]: float(avgs[i]) for i in best}
+
+def avg_monthly_rating(reviews: Reviews, park: str) -> Dict[str, float]:
     """Calculates monthly average rating for a park.
 
     Args:
-        reviews: List of reviews
+        reviews: Loaded reviews
         park: Park name
 
     Returns:
-        OrderedDict with monthly averages ordered from Jan to Dec
+        Dictionary with monthly averages ordered from Jan to Dec
     """
-    month_map = {
-        '01': 'Jan', '02': 'Feb', '03': 'Mar',
-        '04': 'Apr', '05': 'May', '06': 'Jun',
-        '07': 'Jul', '08': 'Aug', '09': 'Sep',
-        '10': 'Oct', '11': 'Nov', '12': 'Dec'
+    return _avg_monthly_rating(reviews, park.casefold())
+
+@lru_cache(maxsize=512)
+def _avg_monthly_rating(reviews: Reviews, park: str) -> Dict[str, float]:
+    """Cached monthly averages for a case-folded park."""
+    rows = _park_rows(reviews, park)
+    # Month 0 collects reviews without a date and is not reported
+    months = reviews.month[rows]
+    sums = np.bincount(months, weights=reviews.ratings[rows], minlength=13)
+    counts = np.bincount(months, minlength=13)
+    avgs = _group_avg(sums, counts)
+
+    return {
+        month_name: float(avgs[month]) if counts[month] else 0
+        for month, month_name in enumerate(MONTH_NAMES, start=1)
     }
-    
-    stats = defaultdict(list)
-    for r in reviews:
-        if r.park.lower() == park.lower():
-            _, month = r.year_month.split("-")
-            month_name = month_map.get(month)
-            if month_name:
-                stats[month_name].append(r.rating)
-    
-    ordered = OrderedDict()
-    for month_name in month_map.values():
-        ordered[month_name] = (
-            sum(stats[month_name]) / len(stats[month_name])
-            if month_name in stats and stats[month_name]
-            else 0
-        )
-    return ordered
 
 # ---------- Section D ---------- #
-def avg_rating_per_park_location(reviews: List[Review]) -> Dict[str, Dict[str, float]]:
+@lru_cache(maxsize=32)
+def avg_rating_per_park_location(reviews: Reviews) -> Dict[str, Dict[str, float]]:
     """Calculates average rating by park and location.
 
     Args:
-        reviews: List of reviews
+        reviews: Loaded reviews
 
     Returns:
         Nested dictionary with averages by park and location
     """
-    tmp: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
-    for r in reviews:
-        tmp[r.park][r.location].append(r.rating)
-    return {
-        p: {loc: sum(v) / len(v) for loc, v in inner.items()}
-        for p, inner in tmp.items()
-    }
+    n_park, n_loc = len(reviews.park_names), len(reviews.loc_names)
+    cells = reviews.park_code * n_loc + reviews.loc_code
+    sums = np.bincount(cells, weights=reviews.ratings, minlength=n_park * n_loc)
+    counts = np.bincount(cells, minlength=n_park * n_loc)
+    avgs = _group_avg(sums, counts).reshape(n_park, n_loc)
+    counts = counts.reshape(n_park, n_loc)
+    # Locations keep the order in which they first appear for each park
+    first_seen = np.full(n_park * n_loc, len(cells))
+    np.minimum.at(first_seen, cells, np.arange(len(cells)))
+    first_seen = first_seen.reshape(n_park, n_loc)
+    result = {}
+    for i, p in enumerate(reviews.park_names):
+        present = np.flatnonzero(counts[i])
+        if len(present):
+            present = present[np.argsort(first_seen[i, present], kind="stable")]
+            result[p] = {reviews.loc_names[j]: float(avgs[i, j]) for j in present}
+    return result
 
 # ---------- Export summary ---------- #
-def park_summary(reviews: List[Review]) -> Dict[str, Dict[str, Union[int, float, Set[str]]]]:
+@lru_cache(maxsize=32)
+def park_summary(reviews: Reviews) -> Dict[str, Dict[str, Union[int, float]]]:
     """Generates statistical summary by park.
 
     Args:
-        reviews: List of reviews
+        reviews: Loaded reviews
 
     Returns:
         Dictionary with statistics per park (total reviews, positives, average, countries)
     """
-    summ = defaultdict(lambda: {"reviews": 0, "positive": 0, "avg": 0.0, "countries": set()})
-    for r in reviews:
-        s = summ[r.park]
-        s["reviews"] += 1
-        s["positive"] += r.rating >= 4
-        s["avg"] += r.rating
-        s["countries"].add(r.location)
-    
-    for s in summ.values():
-        s["avg"] = round(s["avg"] / s["reviews"], 2)
-        s["countries"] = len(s["countries"])
-    return summ
+    park_code, loc_code, ratings = reviews.park_code, reviews.loc_code, reviews.ratings
+    n_park = len(reviews.park_names)
+    counts = np.diff(reviews.park_offsets)
+    sums = _park_sums(reviews, ratings)
+    positive = _park_sums(reviews, ratings >= 4)
+    avgs = _group_avg(sums, counts)
+
+    # Distinct locations per park from a (park, location) presence bitmap
+    seen = np.zeros((n_park, len(reviews.loc_names)), dtype=bool)
+    seen[park_code, loc_code] = True
+    countries = seen.sum(axis=1)
+    return {
+        p: {
+            "reviews": int(counts[i]),
+            "positive": int(positive[i]),
+            "avg": round(float(avgs[i]), 2),
+            "countries": int(countries[i]),
+        }
+        for i, p in enumerate(reviews.park_names)
+        if counts[i]
+    }
+
+def _clear_query_caches() -> None:
+    """Drops memoized query results so old datasets can be released."""
+    for query in (
+        _count_reviews_by_park_and_location,
+        _avg_rating_by_park_year,
+        reviews_count_per_park,
+        avg_rating_per_park,
+        _top_locations_for_park,
+        _avg_monthly_rating,
+        avg_rating_per_park_location,
+        park_summary,
+    ):
+        query.cache_clear()
@@ -3,31 +3,117 @@ Unit tests for the process.py module.
 """
 from pathlib import Path
 import pytest
+import process
 from process import (
     Review,
+    Reviews,
     load_reviews,
+    get_reviews_by_park,
+    count_reviews_by_park_and_location,
     avg_rating_by_park_year,
     reviews_count_per_park,
     avg_rating_per_park,
+    avg_monthly_rating,
+    avg_rating_per_park_location,
     park_summary
 )
 
 # Test data
-SAMPLE_REVIEWS = [
+SAMPLE_REVIEWS = Reviews.from_records([
     Review(id=1, rating=5, year_month="2019-01", location="Brazil", park="Disneyland Paris"),
     Review(id=2, rating=4, year_month="2019-01", location="USA", park="Disneyland Paris"),
     Review(id=3, rating=3, year_month="2019-02", location="France", park="Disneyland Paris"),
     Review(id=4, rating=5, year_month="2020-01", location="Brazil", park="Disney World Orlando"),
     Review(id=5, rating=4, year_month="2020-01", location="USA", park="Disney World Orlando"),
-]
+])
 
 def test_load_reviews():
     """Tests if load_reviews function loads the correct number of lines."""
     csv_path = Path(__file__).parent.parent / "data" / "disneyland_reviews.csv"
     reviews = load_reviews(csv_path)
     assert len(reviews) > 0, "Dataset should contain reviews"
+    assert isinstance(reviews, Reviews), "Dataset should be loaded as Reviews"
+    assert len(reviews.park_names) == 3, "Dataset covers three parks"
     assert all(isinstance(r, Review) for r in reviews), "All entries should be Reviews"
 
+SAMPLE_CSV = (
+    "Review_ID,Rating,Year_Month,Reviewer_Location,Branch\n"
+    "1,5,2019-4,Brazil,Disneyland_Paris\n"
+    "2,3,missing,USA,Disneyland_HongKong\n"
+    "3,4,2019-13,France,Disneyland_Paris\n"
+)
+
+def test_csv_parsers_agree(tmp_path):
+    """Tests the pandas parser matches the csv.reader fallback."""
+    pytest.importorskip("pandas")
+    csv_path = tmp_path / "reviews.csv"
+    csv_path.write_text(SAMPLE_CSV, encoding="utf-8")
+    fast = process._parse_csv(csv_path)
+    fallback = process._parse_csv_reader(csv_path)
+    assert list(fast) == list(fallback)
+    assert fast.park_names == fallback.park_names
+    assert fast.ratings.dtype == fallback.ratings.dtype
+
+def test_csv_reader_reports_missing_columns(tmp_path):
+    """Tests the csv.reader parser names the columns it cannot find."""
+    csv_path = tmp_path / "reviews.csv"
+    csv_path.write_text("Review_ID,Rating,Branch\n1,5,Disneyland_Paris\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Year_Month, Reviewer_Location"):
+        process._parse_csv_reader(csv_path)
+
+def test_load_reviews_empty_csv(tmp_path):
+    """Tests an empty CSV loads as an empty collection with both parsers."""
+    csv_path = tmp_path / "reviews.csv"
+    csv_path.write_text("", encoding="utf-8")
+    assert len(process._parse_csv_reader(csv_path)) == 0
+    assert len(load_reviews(csv_path)) == 0
+    assert park_summary(load_reviews(csv_path)) == {}
+
+def test_load_reviews_uses_cache(tmp_path):
+    """Tests parsed data is cached next to the CSV and refreshed on change."""
+    csv_path = tmp_path / "reviews.csv"
+    csv_path.write_text(SAMPLE_CSV, encoding="utf-8")
+    parsed = load_reviews(csv_path)
+    assert csv_path.with_suffix(".npz").exists()
+    cached = load_reviews(csv_path)
+    assert list(cached) == list(parsed)
+    assert [r.year_month for r in cached] == ["2019-04", "2019", "missing"]
+
+    with open(csv_path, "a", encoding="utf-8") as fp:
+        fp.write("4,4,2020-1,France,Disneyland_Paris\n")
+    assert len(load_reviews(csv_path)) == 4
+
+def test_get_reviews_by_park():
+    """Tests park filtering is case-insensitive and keeps row data."""
+    paris = get_reviews_by_park(SAMPLE_REVIEWS, "disneyland paris")
+    assert len(paris) == 3
+    assert [r.id for r in paris] == [1, 2, 3]
+    assert [r.year_month for r in paris] == ["2019-01", "2019-01", "2019-02"]
+    assert len(get_reviews_by_park(SAMPLE_REVIEWS, "Unknown Park")) == 0
+
+def test_reviews_grouped_by_park():
+    """Tests interleaved rows are grouped by park, keeping their order."""
+    reviews = Reviews.from_records([
+        Review(id=1, rating=5, year_month="2019-01", location="Brazil", park="A"),
+        Review(id=2, rating=4, year_month="2019-01", location="USA", park="B"),
+        Review(id=3, rating=3, year_month="2019-02", location="France", park="A"),
+    ])
+    assert [r.id for r in reviews] == [1, 3, 2]
+    assert [r.id for r in get_reviews_by_park(reviews, "b")] == [2]
+    assert reviews_count_per_park(reviews) == {"A": 2, "B": 1}
+
+def test_count_reviews_by_park_and_location():
+    """Tests case-insensitive park match and partial location match."""
+    assert count_reviews_by_park_and_location(SAMPLE_REVIEWS, "DISNEYLAND PARIS", "us") == 1
+    assert count_reviews_by_park_and_location(SAMPLE_REVIEWS, "disneyland paris", "a") == 3
+    assert count_reviews_by_park_and_location(SAMPLE_REVIEWS, "Unknown Park", "a") == 0
+
+    # Case folding matches beyond lower(), e.g. German sharp s
+    reviews = Reviews.from_records([
+        Review(id=1, rating=5, year_month="2019-01", location="Großbritannien", park="Disneyland Paris"),
+    ])
+    assert count_reviews_by_park_and_location(reviews, "disneyland paris", "GROSS") == 1
+
 def test_avg_rating_by_park_year():
     """Tests annual average calculation with known dataset."""
     # Average for Disneyland Paris in 2019: (5 + 4 + 3) / 3 = 4.0
@@ -42,6 +128,30 @@ def test_avg_rating_by_park_year():
     avg = avg_rating_by_park_year(SAMPLE_REVIEWS, "Disneyland Paris", "2020")
     assert avg is None
 
+def test_park_queries_are_memoized():
+    """Tests repeated queries share one cached result regardless of case."""
+    first = avg_monthly_rating(SAMPLE_REVIEWS, "Disneyland Paris")
+    assert avg_monthly_rating(SAMPLE_REVIEWS, "DISNEYLAND PARIS") is first
+    assert park_summary(SAMPLE_REVIEWS) is park_summary(SAMPLE_REVIEWS)
+
+def test_year_only_dates_count_for_their_year():
+    """Tests a date without a month still counts towards its year."""
+    reviews = Reviews.from_records([
+        Review(id=1, rating=5, year_month="2019", location="Brazil", park="Disneyland Paris"),
+        Review(id=2, rating=3, year_month="2019-05", location="USA", park="Disneyland Paris"),
+    ])
+    assert avg_rating_by_park_year(reviews, "Disneyland Paris", "2019") == 4.0
+    assert [r.year_month for r in reviews] == ["2019", "2019-05"]
+
+def test_undated_reviews_match_no_year():
+    """Tests reviews with a missing date are not averaged as year 0000."""
+    reviews = Reviews.from_records([
+        Review(id=1, rating=5, year_month="missing", location="Brazil", park="Disneyland Paris"),
+        Review(id=2, rating=3, year_month="2019-05", location="USA", park="Disneyland Paris"),
+    ])
+    assert avg_rating_by_park_year(reviews, "Disneyland Paris", "0000") is None
+    assert avg_rating_by_park_year(reviews, "Disneyland Paris", "2019") == 3.0
+
 def test_reviews_count_per_park():
     """Tests review count by park."""
     counts = reviews_count_per_park(SAMPLE_REVIEWS)
@@ -56,6 +166,30 @@ def test_avg_rating_per_park():
     # Disney World: (5 + 4) / 2 = 4.5
     assert avgs["Disney World Orlando"] == 4.5
 
+def test_avg_monthly_rating():
+    """Tests monthly averages are ordered Jan to Dec with 0 for empty months."""
+    monthly = avg_monthly_rating(SAMPLE_REVIEWS, "Disneyland Paris")
+    assert list(monthly)[:3] == ["Jan", "Feb", "Mar"]
+    assert len(monthly) == 12
+    # January: (5 + 4) / 2 = 4.5, February: 3
+    assert monthly["Jan"] == 4.5
+    assert monthly["Feb"] == 3.0
+    assert monthly["Mar"] == 0
+
+def test_avg_rating_per_park_location_order():
+    """Tests locations are listed in first-appearance order within each park."""
+    reviews = Reviews.from_records([
+        Review(id=1, rating=5, year_month="2019-01", location="Brazil", park="A"),
+        Review(id=2, rating=4, year_month="2019-01", location="USA", park="A"),
+        Review(id=3, rating=3, year_month="2019-02", location="France", park="B"),
+        Review(id=4, rating=2, year_month="2019-02", location="USA", park="B"),
+        Review(id=5, rating=1, year_month="2019-03", location="Brazil", park="B"),
+    ])
+    stats = avg_rating_per_park_location(reviews)
+    assert list(stats["A"]) == ["Brazil", "USA"]
+    assert list(stats["B"]) == ["France", "USA", "Brazil"]
+    assert stats["B"]["USA"] == 2.0
+
 def test_park_summary():
     """Tests park summary generation."""
     summary = park_summary(SAMPLE_REVIEWS)
@@ -70,4 +204,12 @@ def test_park_summary():
     assert orlando["reviews"] == 2
     assert orlando["positive"] == 2  # ratings >= 4
     assert orlando["avg"] == 4.5
-    assert orlando["countries"] == 2  # Brazil, USA
\ No newline at end of file
+    assert orlando["countries"] == 2  # Brazil, USA
+
+def test_park_summary_skips_parks_without_reviews():
+    """Tests per-park totals on a subset where some parks have no rows."""
+    orlando = get_reviews_by_park(SAMPLE_REVIEWS, "Disney World Orlando")
+    summary = park_summary(orlando)
+    assert list(summary) == ["Disney World Orlando"]
+    assert summary["Disney World Orlando"]["positive"] == 2
+    assert avg_rating_per_park(orlando) == {"Disney World Orlando": 4.5}
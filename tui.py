@@ -2,8 +2,9 @@
 Text User Interface (TUI) module.
 Contains all text input and output functions for the program.
 """
-from typing import Dict, List
-from process import Review
+import sys
+from typing import Dict
+from process import Reviews
 
 BANNER = """
 ╔════════════════════════════════════════╗
@@ -93,15 +94,15 @@ def export_menu() -> str:
     print("\n=== EXPORT SUMMARY === (TXT / CSV / JSON)")
     return ask("Format")
 
-def show_reviews(reviews: List[Review]) -> None:
+def show_reviews(reviews: Reviews) -> None:
     """Displays formatted list of reviews.
 
     Args:
-        reviews: List of reviews to display
+        reviews: Reviews to display
     """
-    for r in reviews:
-        print(f"{r.id} | {r.rating}⭐ | {r.year_month} | {r.location}")
-    print(f"Total: {len(reviews)} review(s)\n")
+    lines = [f"{r.id} | {r.rating}⭐ | {r.year_month} | {r.location}\n" for r in reviews]
+    lines.append(f"Total: {len(reviews)} review(s)\n\n")
+    sys.stdout.write("".join(lines))
 
 def show_table(stats: Dict[str, Dict[str, float]]) -> None:
     """Displays statistics table by park and location.
@@ -109,8 +110,10 @@ def show_table(stats: Dict[str, Dict[str, float]]) -> None:
     Args:
         stats: Nested dictionary with averages by park and location
     """
+    lines = []
     for park, locs in stats.items():
-        print(f"\n### {park}")
+        lines.append(f"\n### {park}\n")
         for loc, avg in sorted(locs.items(), key=lambda x: x[1], reverse=True):
-            print(f"{loc:<30} {avg:>4.2f}")
-    print()
+            lines.append(f"{loc:<30} {avg:>4.2f}\n")
+    lines.append("\n")
+    sys.stdout.write("".join(lines))
@@ -3,9 +3,24 @@ Module responsible for graph generation using matplotlib.
 Contains functions for visualizing different aspects of Disney reviews.
 """
 from typing import Dict
-import matplotlib
-matplotlib.use('TkAgg') 
-import matplotlib.pyplot as plt
+
+_plt = None
+
+def _pyplot():
+    """Imports matplotlib on first use so startup does not pay for it.
+
+    Returns:
+        The matplotlib.pyplot module, with backend and defaults configured
+    """
+    global _plt
+    if _plt is None:
+        import matplotlib
+        matplotlib.use('TkAgg')
+        import matplotlib.pyplot as plt
+        matplotlib.rcParams['font.size'] = 10
+        matplotlib.rcParams['figure.autolayout'] = True
+        _plt = plt
+    return _plt
 
 def _fmt_title(title: str) -> None:
     """Formats the graph title with standard size and layout.
@@ -13,6 +28,7 @@ def _fmt_title(title: str) -> None:
     Args:
         title: Graph title text
     """
+    plt = _pyplot()
     plt.title(title, fontsize=12)
     plt.tight_layout()
 
@@ -22,6 +38,7 @@ def pie_reviews_per_park(counts: Dict[str, int]) -> None:
     Args:
         counts: Dictionary with review count by park
     """
+    plt = _pyplot()
     plt.figure(figsize=(10, 6))
     plt.pie(counts.values(), labels=counts.keys(), autopct="%d")
     _fmt_title("Number of Reviews by Park")
@@ -33,6 +50,7 @@ def bar_avg_rating_per_park(avgs: Dict[str, float]) -> None:
     Args:
         avgs: Dictionary with average rating by park
     """
+    plt = _pyplot()
     plt.figure(figsize=(10, 6))
     plt.bar(avgs.keys(), avgs.values())
     _fmt_title("Average Rating by Park")
@@ -46,6 +64,7 @@ def bar_top_locations(data: Dict[str, float], park: str) -> None:
         data: Dictionary with averages by location
         park: Park name for the title
     """
+    plt = _pyplot()
     plt.figure(figsize=(12, 6))
     plt.bar(data.keys(), data.values())
     _fmt_title(f"Top 10 Locations by Average Rating – {park}")
@@ -60,11 +79,9 @@ def bar_monthly_rating(data: Dict[str, float], park: str) -> None:
         data: Dictionary with averages by month
         park: Park name for the title
     """
+    plt = _pyplot()
     plt.figure(figsize=(10, 6))
     plt.bar(data.keys(), data.values())
     _fmt_title(f"Monthly Rating Average – {park}")
     plt.ylabel("Average Rating")
     plt.show()
-
-matplotlib.rcParams['font.size'] = 10
-matplotlib.rcParams['figure.autolayout'] = True